@@ -7,26 +7,48 @@ use egui_plot::{Corner, GridMark, Legend, Line, Plot, PlotPoints, Points};
 use image;
 use std::collections::HashMap;
 use std::fs;
-use std::io::{BufRead, BufReader};
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 
 mod utils;
 
+const STATION_LINE_COLORS: [egui::Color32; 4] = [
+    egui::Color32::from_rgb(0, 200, 0),
+    egui::Color32::from_rgb(200, 0, 0),
+    egui::Color32::from_rgb(0, 0, 200),
+    egui::Color32::from_rgb(200, 200, 0),
+];
+
+fn grid_marks(values: &[f64], step_size: f64) -> Vec<GridMark> {
+    values
+        .iter()
+        .map(|&value| GridMark { value, step_size })
+        .collect()
+}
+
 fn apply_station_line_style(line: Line, station_idx: usize) -> Line {
-    match station_idx % 4 {
-        0 => line.stroke(egui::Stroke::new(2.0, egui::Color32::from_rgb(0, 200, 0))), // Solid
-        1 => line
-            .stroke(egui::Stroke::new(2.0, egui::Color32::from_rgb(200, 0, 0)))
-            .style(egui_plot::LineStyle::Dashed { length: 10.0 }),
-        2 => line
-            .stroke(egui::Stroke::new(2.0, egui::Color32::from_rgb(0, 0, 200)))
-            .style(egui_plot::LineStyle::Dotted { spacing: 5.0 }),
-        _ => line
-            .stroke(egui::Stroke::new(2.0, egui::Color32::from_rgb(200, 200, 0))),
+    let line = line.stroke(egui::Stroke::new(
+        2.0,
+        STATION_LINE_COLORS[station_idx % STATION_LINE_COLORS.len()],
+    ));
+    match station_idx % STATION_LINE_COLORS.len() {
+        1 => line.style(egui_plot::LineStyle::Dashed { length: 10.0 }),
+        2 => line.style(egui_plot::LineStyle::Dotted { spacing: 5.0 }),
+        _ => line, // Solid
     }
 }
 
 const PLOT_Y_AXIS_MIN_WIDTH: f32 = 96.0;
+const UT_HOUR_TICKS: [f64; 25] = [
+    0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0,
+    17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0,
+];
+const AZ_TICKS: [f64; 13] = [
+    0.0, 30.0, 60.0, 90.0, 120.0, 150.0, 180.0, 210.0, 240.0, 270.0, 300.0, 330.0, 360.0,
+];
+const EL_TICKS: [f64; 10] = [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0];
+const PLOT_SAMPLE_STEP_MINUTES: usize = 3;
+const PLOT_SAMPLES_PER_DAY: usize = 24 * 60 / PLOT_SAMPLE_STEP_MINUTES;
 
 const SKD_COL_NUM: f32 = 24.0;
 const SKD_COL_SOURCE: f32 = 116.0;
@@ -213,18 +235,15 @@ impl Antenna {
 }
 
 type ScanEnd = (chrono::NaiveDateTime, f64, f64);
+type ScanEpoch = (chrono::NaiveDateTime, f64);
 
 fn antenna_motion_status(
-    row: &SkdRow,
-    source: &Source,
     antenna: &Antenna,
+    scan: Option<(ScanEnd, ScanEnd)>,
     prev_end: Option<ScanEnd>,
 ) -> (String, Option<ScanEnd>) {
-    match (
-        scan_az_el_for(row, source, antenna.pos, false),
-        scan_az_el_for(row, source, antenna.pos, true),
-    ) {
-        (Some((start_dt, start_az, start_el)), Some((end_dt, end_az, end_el))) => {
+    match scan {
+        Some(((start_dt, start_az, start_el), (end_dt, end_az, end_el))) => {
             let limit_text = if antenna.allows(start_az, start_el) && antenna.allows(end_az, end_el)
             {
                 "OK"
@@ -252,7 +271,7 @@ fn antenna_motion_status(
             };
             (motion, Some((end_dt, end_az, end_el)))
         }
-        _ => ("NO".to_string(), None),
+        None => ("NO".to_string(), None),
     }
 }
 
@@ -305,6 +324,19 @@ fn show_status_token(ui: &mut egui::Ui, token: &str, width: f32) {
     );
 }
 
+/// Source name, station name, legend label, Az points, El points and station index.
+type PlotTrack = (String, String, String, Vec<[f64; 2]>, Vec<[f64; 2]>, usize);
+/// Legend label, Az points, El points and station index against LST.
+type LstPlotTrack = (String, Vec<[f64; 2]>, Vec<[f64; 2]>, usize);
+/// Legend label, track points, hour marker points, hour labels and station index.
+type PolarPlotTrack = (
+    String,
+    Vec<[f64; 2]>,
+    Vec<[f64; 2]>,
+    Vec<(f64, f64, String)>,
+    usize,
+);
+
 struct UptimePlotApp {
     stations: Vec<Station>,
     selected_date: NaiveDate,
@@ -347,16 +379,9 @@ struct UptimePlotApp {
     target_picker_filter: String,
     cal_picker_filter: String,
     five_point_picker_filter: String,
-    plot_data: Vec<(String, String, Vec<[f64; 2]>, Vec<[f64; 2]>, usize)>,
-    lst_plot_data: Vec<(String, String, Vec<[f64; 2]>, Vec<[f64; 2]>, usize)>,
-    polar_plot_data: Vec<(
-        String,
-        String,
-        Vec<[f64; 2]>,
-        Vec<[f64; 2]>,
-        Vec<(f64, f64, String)>,
-        usize,
-    )>,
+    plot_data: Vec<PlotTrack>,
+    lst_plot_data: Vec<LstPlotTrack>,
+    polar_plot_data: Vec<PolarPlotTrack>,
     error_msg: Option<String>,
     show_calendar: bool,
     show_new_skd_calendar: bool,
@@ -388,31 +413,9 @@ impl UptimePlotApp {
         // Determine source_file_path
         let source_file_path = cli_args.source_path.unwrap_or(default_source_path);
 
-        let stations: Vec<Station> = {
-            let mut stations_vec = Vec::new();
-            if let Ok(file) = fs::File::open(&station_file_path) {
-                let reader = BufReader::new(file);
-                for line in reader.lines() {
-                    if let Ok(line) = line {
-                        let parts: Vec<&str> = line.trim().split_whitespace().collect();
-                        if parts.len() == 4 {
-                            if let (Ok(pos_x), Ok(pos_y), Ok(pos_z)) = (
-                                parts[1].parse::<f64>(),
-                                parts[2].parse::<f64>(),
-                                parts[3].parse::<f64>(),
-                            ) {
-                                stations_vec.push(Station {
-                                    name: parts[0].to_string(),
-                                    pos: [pos_x, pos_y, pos_z],
-                                    selected: parts[0] == "YAMAGU32",
-                                });
-                            }
-                        }
-                    }
-                }
-            }
-            stations_vec
-        };
+        let stations: Vec<Station> = fs::read_to_string(&station_file_path)
+            .map(|content| parse_stations_lenient(&content))
+            .unwrap_or_default();
 
         let mut app = Self {
             stations,
@@ -632,32 +635,7 @@ impl UptimePlotApp {
         let station_content = fs::read_to_string(&self.station_file_path)
             .map_err(|e| format!("Failed to read station file: {}", e))?;
 
-        let mut stations_vec = Vec::new();
-        for line in station_content.lines() {
-            let line = line.trim();
-            if line.is_empty() || line.starts_with('*') {
-                continue;
-            }
-            let parts: Vec<&str> = line.split_whitespace().collect();
-            if parts.len() == 4 {
-                if let (Ok(pos_x), Ok(pos_y), Ok(pos_z)) = (
-                    parts[1].parse::<f64>(),
-                    parts[2].parse::<f64>(),
-                    parts[3].parse::<f64>(),
-                ) {
-                    stations_vec.push(Station {
-                        name: parts[0].to_string(),
-                        pos: [pos_x, pos_y, pos_z],
-                        selected: parts[0] == "YAMAGU32",
-                    });
-                } else {
-                    return Err(format!("Invalid number format in station file: {}", line));
-                }
-            } else {
-                return Err(format!("Invalid line format in station file: {}", line));
-            }
-        }
-        self.stations = stations_vec;
+        self.stations = parse_stations_strict(&station_content)?;
         Ok(())
     }
 
@@ -668,6 +646,7 @@ impl UptimePlotApp {
         }
 
         let mut new_plot_data = Vec::new();
+        let mut new_lst_plot_data = Vec::new();
         let selected_stations: Vec<(usize, &Station)> = self
             .stations
             .iter()
@@ -680,57 +659,62 @@ impl UptimePlotApp {
             return;
         }
 
-        for (station_idx, station) in selected_stations {
-            let ant_pos = station.pos;
-            for (source, selected) in &self.sources {
-                if !*selected {
-                    continue;
-                }
-
-                let mut full_day_points = Vec::new();
-                for i in (0..=(24 * 60)).step_by(3) {
-                    let hour_float = (i as f64) / 60.0;
-                    let h = (i / 60) as u32;
-                    let m = (i % 60) as u32;
-
-                    if let Some(time) = self.selected_date.and_hms_opt(h, m, 0) {
-                        let datetime_utc = Utc.from_utc_datetime(&time);
-                        let (az, el, _) =
-                            utils::radec2azalt(ant_pos, datetime_utc, source.ra_rad, source.dec_rad);
-                        full_day_points.push((hour_float, az, el));
-                    }
-                }
-
-                let mut az_points = Vec::new();
-                let mut el_points = Vec::new();
+        let selected_sources: Vec<&Source> = self
+            .sources
+            .iter()
+            .filter(|(_, selected)| *selected)
+            .map(|(source, _)| source)
+            .collect();
 
-                if let Some(last_point) = full_day_points.get(0) {
-                    if last_point.2 >= 0.0 {
-                        az_points.push([last_point.0, last_point.1]);
-                        el_points.push([last_point.0, last_point.2]);
-                    }
+        // Sidereal time depends only on the date, geodetic position only on the station.
+        let (day_hours, day_sidereals) = build_day_frame(self.selected_date);
 
-                    for &point in full_day_points.iter().skip(1) {
-                        let (hour, az, el) = point;
-                        az_points.push([hour, az]);
-                        if el >= 0.0 {
-                            el_points.push([hour, el]);
-                        } else {
-                            el_points.push([hour, f64::NAN]);
-                        }
-                    }
-                }
-                new_plot_data.push((
-                    source.name.clone(),
-                    station.name.clone(),
-                    az_points,
-                    el_points,
+        // A single station (the default) is not worth spawning a thread for.
+        let station_tracks: Vec<Vec<(PlotTrack, LstPlotTrack)>> =
+            if let &[(station_idx, station)] = selected_stations.as_slice() {
+                vec![station_plot_tracks(
                     station_idx,
-                ));
-            }
+                    station,
+                    &selected_sources,
+                    &day_hours,
+                    &day_sidereals,
+                )]
+            } else {
+                std::thread::scope(|scope| {
+                    let handles: Vec<_> = selected_stations
+                        .iter()
+                        .map(|&(station_idx, station)| {
+                            let selected_sources = &selected_sources;
+                            let day_hours = &day_hours;
+                            let day_sidereals = &day_sidereals;
+                            scope.spawn(move || {
+                                station_plot_tracks(
+                                    station_idx,
+                                    station,
+                                    selected_sources,
+                                    day_hours,
+                                    day_sidereals,
+                                )
+                            })
+                        })
+                        .collect();
+                    handles
+                        .into_iter()
+                        .map(|handle| {
+                            handle
+                                .join()
+                                .unwrap_or_else(|payload| std::panic::resume_unwind(payload))
+                        })
+                        .collect()
+                })
+            };
+
+        for (plot_track, lst_track) in station_tracks.into_iter().flatten() {
+            new_plot_data.push(plot_track);
+            new_lst_plot_data.push(lst_track);
         }
         self.plot_data = new_plot_data;
-        self.lst_plot_data = self.build_lst_plot_data();
+        self.lst_plot_data = new_lst_plot_data;
         self.polar_plot_data = self.build_polar_plot_data();
     }
 
@@ -746,94 +730,36 @@ impl UptimePlotApp {
         Some(utils::utc_to_lst_hours(station_pos, datetime))
     }
 
-    fn build_lst_plot_data(&self) -> Vec<(String, String, Vec<[f64; 2]>, Vec<[f64; 2]>, usize)> {
-        let mut lst_plot_data = Vec::new();
-
-        for (source_name, station_name, az_points, el_points, station_idx) in &self.plot_data {
-            let station_pos = self
-                .stations
-                .iter()
-                .find(|s| &s.name == station_name)
-                .map(|s| s.pos)
-                .unwrap_or([0.0, 0.0, 0.0]);
-
-            let mut lst_az_points = Vec::new();
-            let mut lst_el_points = Vec::new();
-            let mut prev_lst: Option<f64> = None;
-
-            for i in 0..az_points.len() {
-                let ut_hour = az_points[i][0];
-                let az = az_points[i][1];
-                let el = el_points[i][1];
-
-                if let Some(lst_hour) = self.lst_from_ut_hour(station_pos, ut_hour) {
-                    if let Some(prev) = prev_lst {
-                        if lst_hour + 12.0 < prev {
-                            lst_az_points.push([f64::NAN, f64::NAN]);
-                            lst_el_points.push([f64::NAN, f64::NAN]);
-                        }
-                    }
-
-                    lst_az_points.push([lst_hour, az]);
-                    lst_el_points.push([lst_hour, el]);
-                    prev_lst = Some(lst_hour);
-                }
-            }
-            lst_plot_data.push((
-                source_name.clone(),
-                station_name.clone(),
-                lst_az_points,
-                lst_el_points,
-                *station_idx,
-            ));
-        }
-        lst_plot_data
-    }
-
-    fn build_polar_plot_data(
-        &self,
-    ) -> Vec<(
-        String,
-        String,
-        Vec<[f64; 2]>,
-        Vec<[f64; 2]>,
-        Vec<(f64, f64, String)>,
-        usize,
-    )> {
+    fn build_polar_plot_data(&self) -> Vec<PolarPlotTrack> {
         let mut polar_plot_data = Vec::new();
 
-        for (source_name, station_name, az_points, el_points, station_idx) in &self.plot_data {
-            let mut polar_points = Vec::new();
+        for (_, _, label, az_points, el_points, station_idx) in &self.plot_data {
+            let mut polar_points = Vec::with_capacity(az_points.len());
             let mut hour_marker_points = Vec::new();
             let mut hour_labels = Vec::new();
+            let label_offset = 0.04;
 
-            for i in 0..az_points.len() {
-                let hour = az_points[i][0];
-                let az = az_points[i][1];
-                let el = el_points[i][1];
-
+            for (&[hour, az], &[_, el]) in az_points.iter().zip(el_points) {
                 if !el.is_nan() && el >= 0.0 {
-                    let angle_rad = (90.0f64 - az).to_radians();
+                    let (angle_sin, angle_cos) = (90.0f64 - az).to_radians().sin_cos();
                     let radius = (90.0 - el) / 90.0;
-                    let x = radius * angle_rad.cos();
-                    let y = radius * angle_rad.sin();
+                    let x = radius * angle_cos;
+                    let y = radius * angle_sin;
                     polar_points.push([x, y]);
 
                     if (hour - hour.round()).abs() < 1e-6 {
                         hour_marker_points.push([x, y]);
                         let label_hour = hour.round() as i32;
-                        let label_offset = 0.04;
                         hour_labels.push((
-                            x + angle_rad.cos() * label_offset,
-                            y + angle_rad.sin() * label_offset,
+                            x + angle_cos * label_offset,
+                            y + angle_sin * label_offset,
                             format!("{:02}h", label_hour),
                         ));
                     }
                 }
             }
             polar_plot_data.push((
-                source_name.clone(),
-                station_name.clone(),
+                label.clone(),
                 polar_points,
                 hour_marker_points,
                 hour_labels,
@@ -1036,7 +962,9 @@ impl UptimePlotApp {
         let mut header = "Time".to_string();
         let mut time_points: Vec<f64> = Vec::new();
 
-        for (i, (source_name, station_name, az_points, _, _)) in self.plot_data.iter().enumerate() {
+        for (i, (source_name, station_name, _, az_points, _, _)) in
+            self.plot_data.iter().enumerate()
+        {
             let label = format!("{}_{}", source_name, station_name);
             header.push_str(&format!(",{},{}", label, label));
             if i == 0 {
@@ -1048,7 +976,7 @@ impl UptimePlotApp {
 
         for &time in &time_points {
             let mut row = format!("{:.2}", time);
-            for (_, _, az_points, el_points, _) in &self.plot_data {
+            for (_, _, _, az_points, el_points, _) in &self.plot_data {
                 let az_val = az_points
                     .iter()
                     .find(|p| (p[0] - time).abs() < 1e-6)
@@ -1393,11 +1321,8 @@ impl UptimePlotApp {
     }
 
     fn sort_skd_rows_by_start_time(&mut self) {
-        self.skd_rows.sort_by(|a, b| {
-            let a_dt = schedule_datetime(a.start_date, &a.start_time).ok();
-            let b_dt = schedule_datetime(b.start_date, &b.start_time).ok();
-            a_dt.cmp(&b_dt)
-        });
+        self.skd_rows
+            .sort_by_cached_key(|row| schedule_datetime(row.start_date, &row.start_time).ok());
         self.mark_skd_status_dirty();
     }
 
@@ -1444,17 +1369,15 @@ impl UptimePlotApp {
                 continue;
             };
 
-            let (start_geometry, end_geometry) = match ant_pos {
-                Some(pos) => match (
-                    scan_az_el_for(row, source, pos, false),
-                    scan_az_el_for(row, source, pos, true),
-                ) {
-                    (Some((_, start_az, start_el)), Some((_, end_az, end_el))) => (
-                        format!("{:5.1}/{:5.1}", start_az, start_el),
-                        format!("{:5.1}/{:5.1}", end_az, end_el),
-                    ),
-                    _ => ("NO".to_string(), "NO".to_string()),
-                },
+            // Sidereal times of the scan are shared by every antenna.
+            let epochs = scan_epochs_for(row);
+            let first_scan = ant_pos.map(|pos| scan_az_el_pair(row, source, pos, epochs));
+            let (start_geometry, end_geometry) = match first_scan {
+                Some(Some(((_, start_az, start_el), (_, end_az, end_el)))) => (
+                    format!("{:5.1}/{:5.1}", start_az, start_el),
+                    format!("{:5.1}/{:5.1}", end_az, end_el),
+                ),
+                Some(None) => ("NO".to_string(), "NO".to_string()),
                 None => ("No antenna".to_string(), "No antenna".to_string()),
             };
 
@@ -1463,8 +1386,13 @@ impl UptimePlotApp {
                 motion_values[0] = "Load ant".to_string();
             } else {
                 for (ant_idx, antenna) in selected_antennas.iter().take(2).enumerate() {
+                    // The geometry columns were computed for the first antenna already.
+                    let scan = match first_scan {
+                        Some(scan) if ant_idx == 0 => scan,
+                        _ => scan_az_el_pair(row, source, antenna.pos, epochs),
+                    };
                     let (antenna_motion, current_end) =
-                        antenna_motion_status(row, source, antenna, prev_ends[ant_idx]);
+                        antenna_motion_status(antenna, scan, prev_ends[ant_idx]);
                     prev_ends[ant_idx] = current_end;
                     motion_values[ant_idx] = antenna_motion;
                 }
@@ -2287,30 +2215,8 @@ impl UptimePlotApp {
             .allow_scroll(false)
             .x_axis_label("") // Re-added
             .x_axis_formatter(|_, _| "".to_string()) // Re-added
-            .x_grid_spacer(|_input| {
-                [
-                    0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0,
-                    15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0,
-                ]
-                .into_iter()
-                .map(|v| GridMark {
-                    value: v,
-                    step_size: 3.0,
-                })
-                .collect::<Vec<_>>()
-            })
-            .y_grid_spacer(|_input| {
-                [
-                    0.0, 30.0, 60.0, 90.0, 120.0, 150.0, 180.0, 210.0, 240.0, 270.0, 300.0, 330.0,
-                    360.0,
-                ]
-                .into_iter()
-                .map(|v| GridMark {
-                    value: v,
-                    step_size: 30.0,
-                })
-                .collect::<Vec<_>>()
-            })
+            .x_grid_spacer(|_input| grid_marks(&UT_HOUR_TICKS, 3.0))
+            .y_grid_spacer(|_input| grid_marks(&AZ_TICKS, 30.0))
             .y_axis_formatter(|m, _| format!("{:.0}", m.value))
             .show_y(true)
             .coordinates_formatter(
@@ -2334,27 +2240,8 @@ impl UptimePlotApp {
             .allow_drag(false)
             .allow_zoom(false)
             .allow_scroll(false)
-            .x_grid_spacer(|_input| {
-                [
-                    0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0,
-                    15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0,
-                ]
-                .into_iter()
-                .map(|v| GridMark {
-                    value: v,
-                    step_size: 3.0,
-                })
-                .collect::<Vec<_>>()
-            })
-            .y_grid_spacer(|_input| {
-                [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0]
-                    .into_iter()
-                    .map(|v| GridMark {
-                        value: v,
-                        step_size: 10.0,
-                    })
-                    .collect::<Vec<_>>()
-            })
+            .x_grid_spacer(|_input| grid_marks(&UT_HOUR_TICKS, 3.0))
+            .y_grid_spacer(|_input| grid_marks(&EL_TICKS, 10.0))
             .x_axis_formatter(|m, _| format!("{:.0}", m.value as u32))
             .y_axis_formatter(|m, _| format!("{:.0}", m.value))
             .show_x(true)
@@ -2371,9 +2258,9 @@ impl UptimePlotApp {
                 [0.0, -5.0],
                 [24.7, 365.0],
             ));
-            for (source_name, station_name, az_points, _, station_idx) in &self.plot_data {
+            for (_, _, label, az_points, _, station_idx) in &self.plot_data {
                 let mut line = Line::new(
-                    format!("{}:{}", source_name, station_name),
+                    label.as_str(),
                     PlotPoints::from_iter(az_points.iter().copied()),
                 );
                 line = apply_station_line_style(line, *station_idx);
@@ -2388,9 +2275,9 @@ impl UptimePlotApp {
                 [0.0, 0.0],
                 [24.7, 91.0],
             ));
-            for (source_name, station_name, _, el_points, station_idx) in &self.plot_data {
+            for (_, _, label, _, el_points, station_idx) in &self.plot_data {
                 let mut line = Line::new(
-                    format!("{}:{}", source_name, station_name),
+                    label.as_str(),
                     PlotPoints::from_iter(el_points.iter().copied()),
                 );
                 line = apply_station_line_style(line, *station_idx);
@@ -2624,73 +2511,30 @@ impl UptimePlotApp {
             .legend(Legend::default());
 
         let polar_response = plot.show(ui, |plot_ui| {
-            // Draw circles for elevation levels (e.g., 0, 30, 60, 90)
-            // 90 deg el is center (radius 0), 0 deg el is outer edge (radius 1)
-            // So, radius = (90 - el) / 90
-            for el_level in [0.0, 15.0, 30.0, 45.0, 60.0, 75.0, 90.0] {
-                let radius = (90.0 - el_level) / 90.0;
-                if radius >= 0.0 {
-                    // Ensure radius is non-negative
-                    let num_segments = 100;
-                    let mut circle_points = Vec::new();
-                    for i in 0..=num_segments {
-                        let angle = i as f64 * 2.0 * std::f64::consts::PI / num_segments as f64;
-                        let x = radius * angle.cos();
-                        let y = radius * angle.sin();
-                        circle_points.push([x, y]);
-                    }
-                    plot_ui.line(
-                        Line::new("", PlotPoints::from(circle_points))
-                            .stroke(egui::Stroke::new(2.0, egui::Color32::DARK_GRAY)),
-                    );
-
-                    // Add elevation labels
-                    if el_level != 90.0 {
-                        // Don't label the center point
-                        let label_text = format!("{:.0}°", el_level);
-                        // Position the label slightly inside the circle, at 0 azimuth (North)
-                        let label_x = radius * (72.0f64).to_radians().cos();
-                        let label_y = radius * (72.0f64).to_radians().sin();
-                        plot_ui.text(
-                            egui_plot::Text::new(
-                                "",
-                                egui_plot::PlotPoint::new(label_x, label_y),
-                                label_text,
-                            )
-                            .color(egui::Color32::DARK_GRAY),
-                        );
-                    }
-                }
-            }
-
-            // Draw radial lines for azimuth (e.g., 0, 90, 180, 270)
-            for az_level in [0.0, 45.0, 90.0, 135.0, 180.0, 225.0, 270.0, 315.0] {
-                let angle_rad = (90.0f64 - az_level).to_radians(); // Adjust for egui_plot's 0 deg at positive x-axis, clockwise
-                let x = 1.0 * angle_rad.cos();
-                let y = 1.0 * angle_rad.sin();
+            let grid = polar_grid();
+            for grid_line in &grid.lines {
                 plot_ui.line(
-                    Line::new("", PlotPoints::from(vec![[0.0, 0.0], [x, y]]))
+                    Line::new("", PlotPoints::from_iter(grid_line.iter().copied()))
                         .stroke(egui::Stroke::new(2.0, egui::Color32::DARK_GRAY)),
                 );
-
-                // Add azimuth labels
-                let label_text = format!("{:.0}°", az_level);
+            }
+            for (label_x, label_y, label_text) in &grid.labels {
                 plot_ui.text(
                     egui_plot::Text::new(
                         "",
-                        egui_plot::PlotPoint::new(x * 1.1, y * 1.1),
-                        label_text,
+                        egui_plot::PlotPoint::new(*label_x, *label_y),
+                        label_text.clone(),
                     )
                     .color(egui::Color32::DARK_GRAY),
                 );
             }
 
-            for (source_name, station_name, polar_points, hour_marker_points, hour_labels, station_idx) in
+            for (label, polar_points, hour_marker_points, hour_labels, station_idx) in
                 &self.polar_plot_data
             {
                 if !polar_points.is_empty() {
                     let mut line = Line::new(
-                        format!("{}:{}", source_name, station_name),
+                        label.as_str(),
                         PlotPoints::from_iter(polar_points.iter().copied()),
                     );
                     line = apply_station_line_style(line, *station_idx);
@@ -2742,30 +2586,8 @@ impl UptimePlotApp {
             .allow_scroll(false)
             .x_axis_label("")
             .x_axis_formatter(|_, _| "".to_string())
-            .x_grid_spacer(|_input| {
-                [
-                    0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0,
-                    15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0,
-                ]
-                .into_iter()
-                .map(|v| GridMark {
-                    value: v,
-                    step_size: 3.0,
-                })
-                .collect::<Vec<_>>()
-            })
-            .y_grid_spacer(|_input| {
-                [
-                    0.0, 30.0, 60.0, 90.0, 120.0, 150.0, 180.0, 210.0, 240.0, 270.0, 300.0, 330.0,
-                    360.0,
-                ]
-                .into_iter()
-                .map(|v| GridMark {
-                    value: v,
-                    step_size: 30.0,
-                })
-                .collect::<Vec<_>>()
-            })
+            .x_grid_spacer(|_input| grid_marks(&UT_HOUR_TICKS, 3.0))
+            .y_grid_spacer(|_input| grid_marks(&AZ_TICKS, 30.0))
             .y_axis_formatter(|m, _| format!("{:.0}", m.value))
             .show_y(true)
             .coordinates_formatter(
@@ -2789,27 +2611,8 @@ impl UptimePlotApp {
             .allow_drag(false)
             .allow_zoom(false)
             .allow_scroll(false)
-            .x_grid_spacer(|_input| {
-                [
-                    0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0,
-                    15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0,
-                ]
-                .into_iter()
-                .map(|v| GridMark {
-                    value: v,
-                    step_size: 3.0,
-                })
-                .collect::<Vec<_>>()
-            })
-            .y_grid_spacer(|_input| {
-                [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0]
-                    .into_iter()
-                    .map(|v| GridMark {
-                        value: v,
-                        step_size: 10.0,
-                    })
-                    .collect::<Vec<_>>()
-            })
+            .x_grid_spacer(|_input| grid_marks(&UT_HOUR_TICKS, 3.0))
+            .y_grid_spacer(|_input| grid_marks(&EL_TICKS, 10.0))
             .x_axis_formatter(|m, _| format!("{:.0}", m.value as u32))
             .y_axis_formatter(|m, _| format!("{:.0}", m.value))
             .show_x(true)
@@ -2826,9 +2629,9 @@ impl UptimePlotApp {
                 [0.0, -5.0],
                 [24.7, 365.0],
             ));
-            for (source_name, station_name, az_points, _, station_idx) in &self.lst_plot_data {
+            for (label, az_points, _, station_idx) in &self.lst_plot_data {
                 let mut line = Line::new(
-                    format!("{}:{}", source_name, station_name),
+                    label.as_str(),
                     PlotPoints::from_iter(az_points.iter().copied()),
                 );
                 line = apply_station_line_style(line, *station_idx);
@@ -2843,9 +2646,9 @@ impl UptimePlotApp {
                 [0.0, 0.0],
                 [24.7, 91.0],
             ));
-            for (source_name, station_name, _, el_points, station_idx) in &self.lst_plot_data {
+            for (label, _, el_points, station_idx) in &self.lst_plot_data {
                 let mut line = Line::new(
-                    format!("{}:{}", source_name, station_name),
+                    label.as_str(),
                     PlotPoints::from_iter(el_points.iter().copied()),
                 );
                 line = apply_station_line_style(line, *station_idx);
@@ -2857,6 +2660,62 @@ impl UptimePlotApp {
     }
 }
 
+struct PolarGrid {
+    lines: Vec<Vec<[f64; 2]>>,
+    labels: Vec<(f64, f64, String)>,
+}
+
+/// Static elevation circles and azimuth spokes of the polar plot, built once.
+fn polar_grid() -> &'static PolarGrid {
+    static GRID: OnceLock<PolarGrid> = OnceLock::new();
+    GRID.get_or_init(|| {
+        // Draw circles for elevation levels (e.g., 0, 30, 60, 90)
+        // 90 deg el is center (radius 0), 0 deg el is outer edge (radius 1)
+        // So, radius = (90 - el) / 90
+        let mut lines = Vec::new();
+        let mut labels = Vec::new();
+        for el_level in [0.0, 15.0, 30.0, 45.0, 60.0, 75.0, 90.0] {
+            let radius = (90.0 - el_level) / 90.0;
+            if radius >= 0.0 {
+                // Ensure radius is non-negative
+                let num_segments = 100;
+                let mut circle_points = Vec::with_capacity(num_segments + 1);
+                for i in 0..=num_segments {
+                    let angle = i as f64 * 2.0 * std::f64::consts::PI / num_segments as f64;
+                    let x = radius * angle.cos();
+                    let y = radius * angle.sin();
+                    circle_points.push([x, y]);
+                }
+                lines.push(circle_points);
+
+                // Add elevation labels
+                if el_level != 90.0 {
+                    // Don't label the center point
+                    let label_text = format!("{:.0}°", el_level);
+                    // Position the label slightly inside the circle, at 0 azimuth (North)
+                    let label_x = radius * (72.0f64).to_radians().cos();
+                    let label_y = radius * (72.0f64).to_radians().sin();
+                    labels.push((label_x, label_y, label_text));
+                }
+            }
+        }
+
+        // Draw radial lines for azimuth (e.g., 0, 90, 180, 270)
+        for az_level in [0.0, 45.0, 90.0, 135.0, 180.0, 225.0, 270.0, 315.0] {
+            let angle_rad = (90.0f64 - az_level).to_radians(); // Adjust for egui_plot's 0 deg at positive x-axis, clockwise
+            let x = 1.0 * angle_rad.cos();
+            let y = 1.0 * angle_rad.sin();
+            lines.push(vec![[0.0, 0.0], [x, y]]);
+
+            // Add azimuth labels
+            let label_text = format!("{:.0}°", az_level);
+            labels.push((x * 1.1, y * 1.1, label_text));
+        }
+
+        PolarGrid { lines, labels }
+    })
+}
+
 const DEFAULT_SOURCE_TXT: &str = include_str!("../source.txt");
 const DEFAULT_ANTENNA_SCH: &str = include_str!("../antenna.sch");
 const DEFAULT_STATION_TXT: &str = include_str!("../station.txt");
@@ -2935,6 +2794,50 @@ fn pick_file_from_command(program: &str, args: &[&str]) -> Result<Option<PathBuf
     }
 }
 
+/// All valid stations of a station file, skipping malformed lines (used at startup).
+fn parse_stations_lenient(content: &str) -> Vec<Station> {
+    content
+        .lines()
+        .filter_map(parse_station_line)
+        .filter_map(Result::ok)
+        .collect()
+}
+
+/// All stations of a station file, failing on the first malformed line (used on reload).
+fn parse_stations_strict(content: &str) -> Result<Vec<Station>, String> {
+    content.lines().filter_map(parse_station_line).collect()
+}
+
+/// Parses one `NAME X_POS Y_POS Z_POS` line; blank and `*` comment lines yield `None`.
+fn parse_station_line(line: &str) -> Option<Result<Station, String>> {
+    let line = line.trim();
+    if line.is_empty() || line.starts_with('*') {
+        return None;
+    }
+    let parts: Vec<&str> = line.split_whitespace().collect();
+    if parts.len() != 4 {
+        return Some(Err(format!(
+            "Invalid line format in station file: {}",
+            line
+        )));
+    }
+    match (
+        parts[1].parse::<f64>(),
+        parts[2].parse::<f64>(),
+        parts[3].parse::<f64>(),
+    ) {
+        (Ok(pos_x), Ok(pos_y), Ok(pos_z)) => Some(Ok(Station {
+            name: parts[0].to_string(),
+            pos: [pos_x, pos_y, pos_z],
+            selected: parts[0] == "YAMAGU32",
+        })),
+        _ => Some(Err(format!(
+            "Invalid number format in station file: {}",
+            line
+        ))),
+    }
+}
+
 fn parse_source_tokens(
     parts: &[&str],
     name_idx: usize,
@@ -3010,28 +2913,47 @@ fn format_source_drg_line(source: &Source) -> String {
     )
 }
 
-fn scan_az_el_for(
+fn scan_epochs_for(row: &SkdRow) -> Option<(ScanEpoch, ScanEpoch)> {
+    let start = schedule_datetime(row.start_date, &row.start_time).ok()?;
+    let end = start + Duration::seconds(row.duration_sec as i64);
+    let epoch = |time: chrono::NaiveDateTime| {
+        let utc = Utc.from_utc_datetime(&time);
+        (time, utils::mean_sidereal_radian(utc))
+    };
+    Some((epoch(start), epoch(end)))
+}
+
+fn scan_az_el_at(
     row: &SkdRow,
     source: &Source,
     ant_pos: [f64; 3],
-    at_end: bool,
-) -> Option<(chrono::NaiveDateTime, f64, f64)> {
-    let start = schedule_datetime(row.start_date, &row.start_time).ok()?;
-    let time = if at_end {
-        start + Duration::seconds(row.duration_sec as i64)
-    } else {
-        start
-    };
-    let utc = Utc.from_utc_datetime(&time);
+    epoch: ScanEpoch,
+) -> (chrono::NaiveDateTime, f64, f64) {
+    let (time, mean_sidereal) = epoch;
     let ra = source.ra_rad + row.ra_offset_deg.to_radians();
     let dec = (source.dec_rad + row.dec_offset_deg.to_radians())
         .clamp((-90.0_f64).to_radians(), 90.0_f64.to_radians());
-    let (az, el, _) = utils::radec2azalt(ant_pos, utc, ra, dec);
-    Some((
+    let geodetic = utils::cached_geodetic(ant_pos);
+    let (az, el) = utils::azalt_from_sidereal(mean_sidereal, &geodetic, ra, dec);
+    (
         time,
         (az + row.az_offset_deg / 60.0).rem_euclid(360.0),
         el + row.el_offset_deg / 60.0,
-    ))
+    )
+}
+
+fn scan_az_el_pair(
+    row: &SkdRow,
+    source: &Source,
+    ant_pos: [f64; 3],
+    epochs: Option<(ScanEpoch, ScanEpoch)>,
+) -> Option<(ScanEnd, ScanEnd)> {
+    epochs.map(|(start_epoch, end_epoch)| {
+        (
+            scan_az_el_at(row, source, ant_pos, start_epoch),
+            scan_az_el_at(row, source, ant_pos, end_epoch),
+        )
+    })
 }
 
 fn five_point_offset_pattern(offset_deg: f64) -> [(f64, f64); 10] {
@@ -3357,6 +3279,88 @@ fn utc_datetime_from_hour(date: NaiveDate, hour: f64) -> Option<chrono::DateTime
     Some(Utc.from_utc_datetime(&(day_start + Duration::seconds(seconds))))
 }
 
+/// UT and LST tracks for every target seen from one station.
+fn station_plot_tracks(
+    station_idx: usize,
+    station: &Station,
+    sources: &[&Source],
+    day_hours: &[f64],
+    day_sidereals: &[f64],
+) -> Vec<(PlotTrack, LstPlotTrack)> {
+    let geodetic = utils::cached_geodetic(station.pos);
+    let station_lst: Vec<f64> = day_sidereals
+        .iter()
+        .map(|&mean_sidereal| utils::lst_hours_from_sidereal(mean_sidereal, &geodetic))
+        .collect();
+    let targets: Vec<(f64, f64)> = sources
+        .iter()
+        .map(|source| (source.ra_rad, source.dec_rad))
+        .collect();
+    let tracks = utils::azalt_tracks(day_sidereals, &geodetic, &targets);
+
+    let mut station_tracks = Vec::with_capacity(sources.len());
+    for (source, track) in sources.iter().zip(&tracks) {
+        let mut az_points = Vec::with_capacity(track.len());
+        let mut el_points = Vec::with_capacity(track.len());
+        let mut lst_az_points = Vec::with_capacity(track.len() + 1);
+        let mut lst_el_points = Vec::with_capacity(track.len() + 1);
+        let mut prev_lst: Option<f64> = None;
+
+        for (i, ((&hour, &(az, el)), &lst_hour)) in
+            day_hours.iter().zip(track).zip(&station_lst).enumerate()
+        {
+            if i == 0 && el < 0.0 {
+                continue;
+            }
+            let el = if el >= 0.0 { el } else { f64::NAN };
+            az_points.push([hour, az]);
+            el_points.push([hour, el]);
+
+            if let Some(prev) = prev_lst {
+                if lst_hour + 12.0 < prev {
+                    lst_az_points.push([f64::NAN, f64::NAN]);
+                    lst_el_points.push([f64::NAN, f64::NAN]);
+                }
+            }
+            lst_az_points.push([lst_hour, az]);
+            lst_el_points.push([lst_hour, el]);
+            prev_lst = Some(lst_hour);
+        }
+
+        let label = format!("{}:{}", source.name, station.name);
+        station_tracks.push((
+            (
+                source.name.clone(),
+                station.name.clone(),
+                label.clone(),
+                az_points,
+                el_points,
+                station_idx,
+            ),
+            (label, lst_az_points, lst_el_points, station_idx),
+        ));
+    }
+    station_tracks
+}
+
+/// UT hours and mean sidereal times (radian) of the plot samples of the day.
+fn build_day_frame(date: NaiveDate) -> (Vec<f64>, Vec<f64>) {
+    let mut hours = Vec::with_capacity(PLOT_SAMPLES_PER_DAY);
+    let mut mean_sidereals = Vec::with_capacity(PLOT_SAMPLES_PER_DAY);
+    for i in (0..PLOT_SAMPLES_PER_DAY).map(|sample| sample * PLOT_SAMPLE_STEP_MINUTES) {
+        let hour_float = (i as f64) / 60.0;
+        let h = (i / 60) as u32;
+        let m = (i % 60) as u32;
+
+        if let Some(time) = date.and_hms_opt(h, m, 0) {
+            let datetime_utc = Utc.from_utc_datetime(&time);
+            hours.push(hour_float);
+            mean_sidereals.push(utils::mean_sidereal_radian(datetime_utc));
+        }
+    }
+    (hours, mean_sidereals)
+}
+
 fn format_hour_hms(hour: f64) -> String {
     if !hour.is_finite() {
         return "--:--:--".to_string();
@@ -3370,6 +3374,39 @@ fn format_hour_hms(hour: f64) -> String {
     format!("{:02}:{:02}:{:02}", hh, mm, ss)
 }
 
+/// Converts only the `w` x `h` region at (`x`, `y`) of a screenshot to RGBA, clamping the
+/// region to the image bounds the same way `image::imageops::crop_imm` does.
+fn crop_color_image(
+    image: &egui::ColorImage,
+    x: u32,
+    y: u32,
+    w: u32,
+    h: u32,
+) -> Option<image::RgbaImage> {
+    let width = image.size[0] as u32;
+    let height = image.size[1] as u32;
+    if image.pixels.len() != width as usize * height as usize {
+        return None;
+    }
+
+    let x = x.min(width);
+    let y = y.min(height);
+    let w = w.min(width - x);
+    let h = h.min(height - y);
+
+    let mut raw_pixels = Vec::with_capacity(w as usize * h as usize * 4);
+    for row in y..y + h {
+        let row_start = row as usize * width as usize + x as usize;
+        for px in &image.pixels[row_start..row_start + w as usize] {
+            raw_pixels.push(px.r());
+            raw_pixels.push(px.g());
+            raw_pixels.push(px.b());
+            raw_pixels.push(px.a());
+        }
+    }
+    image::RgbaImage::from_raw(w, h, raw_pixels)
+}
+
 fn save_plot_region_png(
     image: &egui::ColorImage,
     rect_points: egui::Rect,
@@ -3383,17 +3420,6 @@ fn save_plot_region_png(
     let width = image.size[0] as u32;
     let height = image.size[1] as u32;
 
-    let mut raw_pixels = Vec::with_capacity(image.pixels.len() * 4);
-    for px in &image.pixels {
-        raw_pixels.push(px.r());
-        raw_pixels.push(px.g());
-        raw_pixels.push(px.b());
-        raw_pixels.push(px.a());
-    }
-
-    let rgba = image::RgbaImage::from_raw(width, height, raw_pixels)
-        .ok_or_else(|| "Failed to build screenshot buffer.".to_string())?;
-
     // Keep margins so axis labels/ticks around plot frames are included.
     let pad_px = (56.0 * pixels_per_point).round() as i32;
     let mut x = (rect_points.min.x * pixels_per_point).floor() as i32 - pad_px;
@@ -3408,8 +3434,8 @@ fn save_plot_region_png(
     w = w.max(1).min(width as i32 - x);
     h = h.max(1).min(height as i32 - y);
 
-    let cropped =
-        image::imageops::crop_imm(&rgba, x as u32, y as u32, w as u32, h as u32).to_image();
+    let cropped = crop_color_image(image, x as u32, y as u32, w as u32, h as u32)
+        .ok_or_else(|| "Failed to build screenshot buffer.".to_string())?;
     cropped
         .save(path)
         .map_err(|e| format!("Failed to save {:?}: {}", path, e))
@@ -3503,6 +3529,91 @@ fn calendar_ui(ui: &mut egui::Ui, date: &mut NaiveDate) -> bool {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_azalt_tracks_matches_astro() {
+        let geodetic = utils::ecef_to_geodetic([-3502544.587, 3950966.235, 3566381.192]);
+        let mean_sidereals: Vec<f64> = (0..48).map(|i| i as f64 * 0.13).collect();
+        let targets = [(0.84, 0.72), (3.25, 0.04), (5.9, -0.61)];
+
+        let tracks = utils::azalt_tracks(&mean_sidereals, &geodetic, &targets);
+        assert_eq!(tracks.len(), targets.len());
+        for (track, &(obs_ra, obs_dec)) in tracks.iter().zip(&targets) {
+            assert_eq!(track.len(), mean_sidereals.len());
+            for (&mean_sidereal, &(az, el)) in mean_sidereals.iter().zip(track) {
+                let (ref_az, ref_el) =
+                    utils::azalt_from_sidereal(mean_sidereal, &geodetic, obs_ra, obs_dec);
+                assert!((ref_az - az).abs() < 1e-9);
+                assert!((ref_el - el).abs() < 1e-9);
+            }
+        }
+    }
+
+    #[test]
+    fn test_parse_station_line() {
+        assert!(parse_station_line("").is_none());
+        assert!(parse_station_line("   ").is_none());
+        assert!(parse_station_line("* YAMAGU32 -3502544.587 3950966.235 3566381.192").is_none());
+
+        match parse_station_line("  YAMAGU32 -3502544.587 3950966.235 3566381.192  ") {
+            Some(Ok(station)) => {
+                assert_eq!(station.name, "YAMAGU32");
+                assert_eq!(station.pos, [-3502544.587, 3950966.235, 3566381.192]);
+                assert!(station.selected);
+            }
+            _ => panic!("expected a parsed station"),
+        }
+
+        match parse_station_line("YAMAGU32 -3502544.587 3950966.235") {
+            Some(Err(msg)) => assert_eq!(
+                msg,
+                "Invalid line format in station file: YAMAGU32 -3502544.587 3950966.235"
+            ),
+            _ => panic!("expected a line format error"),
+        }
+
+        match parse_station_line("USUDA64 -3855355.4 3427427.6 abc") {
+            Some(Err(msg)) => assert_eq!(
+                msg,
+                "Invalid number format in station file: USUDA64 -3855355.4 3427427.6 abc"
+            ),
+            _ => panic!("expected a number format error"),
+        }
+
+        let content =
+            "* comment\n\nYAMAGU32 -3502544.587 3950966.235 3566381.192\nBROKEN 1.0 2.0\n";
+        let lenient = parse_stations_lenient(content);
+        assert_eq!(lenient.len(), 1);
+        assert_eq!(lenient[0].name, "YAMAGU32");
+        match parse_stations_strict(content) {
+            Err(msg) => assert_eq!(msg, "Invalid line format in station file: BROKEN 1.0 2.0"),
+            Ok(_) => panic!("expected the strict parser to reject the file"),
+        }
+    }
+
+    #[test]
+    fn test_crop_color_image_matches_crop_imm() {
+        let size = [7, 5];
+        let rgba: Vec<u8> = (0..size[0] * size[1])
+            .flat_map(|i| [i as u8, (i * 3) as u8, (i * 7) as u8, 255])
+            .collect();
+        let color_image = egui::ColorImage::from_rgba_unmultiplied(size, &rgba);
+        let full_pixels: Vec<u8> = color_image
+            .pixels
+            .iter()
+            .flat_map(|px| px.to_array())
+            .collect();
+        let full = image::RgbaImage::from_raw(size[0] as u32, size[1] as u32, full_pixels)
+            .expect("full screenshot buffer");
+
+        // Whole image, interior region, region clamped at the right/bottom edges, corner pixel.
+        for (x, y, w, h) in [(0, 0, 7, 5), (2, 1, 3, 2), (4, 3, 10, 10), (6, 4, 1, 1)] {
+            let cropped = crop_color_image(&color_image, x, y, w, h).expect("cropped buffer");
+            let expected = image::imageops::crop_imm(&full, x, y, w, h).to_image();
+            assert_eq!(cropped.dimensions(), expected.dimensions());
+            assert_eq!(cropped.as_raw(), expected.as_raw());
+        }
+    }
+
     #[test]
     fn test_slew_seconds() {
         let antenna = Antenna {
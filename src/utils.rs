@@ -3,15 +3,39 @@ use chrono::{DateTime, Datelike, Timelike, Utc};
 use astro::coords;
 use astro::time;
 use nav_types::{ECEF, WGS84};
+use std::collections::HashMap;
 use std::path::Path;
 use std::process::Command;
+use std::sync::{Mutex, OnceLock};
 
-pub fn radec2azalt(
-    ant_position: [f64; 3],
-    time: DateTime<Utc>,
-    obs_ra: f64,
-    obs_dec: f64,
-) -> (f64, f64, f64) {
+#[derive(Clone, Copy)]
+pub struct Geodetic {
+    pub longitude_radian: f64,
+    pub latitude_radian: f64,
+}
+
+pub fn ecef_to_geodetic(ant_position: [f64; 3]) -> Geodetic {
+    let ecef_position = ECEF::new(ant_position[0], ant_position[1], ant_position[2]);
+    let wgs84_position: WGS84<f64> = ecef_position.into();
+    Geodetic {
+        longitude_radian: wgs84_position.longitude_radians(),
+        latitude_radian: wgs84_position.latitude_radians(),
+    }
+}
+
+/// Same as `ecef_to_geodetic`, memoized on the exact ECEF coordinates.
+pub fn cached_geodetic(ant_position: [f64; 3]) -> Geodetic {
+    static CACHE: OnceLock<Mutex<HashMap<[u64; 3], Geodetic>>> = OnceLock::new();
+    let key = ant_position.map(f64::to_bits);
+    match CACHE.get_or_init(|| Mutex::new(HashMap::new())).lock() {
+        Ok(mut cache) => *cache
+            .entry(key)
+            .or_insert_with(|| ecef_to_geodetic(ant_position)),
+        Err(_) => ecef_to_geodetic(ant_position),
+    }
+}
+
+pub fn mean_sidereal_radian(time: DateTime<Utc>) -> f64 {
     let obs_year = time.year() as i16;
     let obs_month = time.month() as u8;
     let obs_day = time.day() as u8;
@@ -31,55 +55,81 @@ pub fn radec2azalt(
         cal_type: time::CalType::Gregorian,
     };
 
-    let ecef_position = ECEF::new(ant_position[0], ant_position[1], ant_position[2]);
-    let wgs84_position: WGS84<f64> = ecef_position.into();
-    let longitude_radian = wgs84_position.longitude_radians();
-    let latitude_radian = wgs84_position.latitude_radians();
-    let height_meter = wgs84_position.altitude();
-
     let julian_day = time::julian_day(&date);
-    let mean_sidereal = time::mn_sidr(julian_day);
-    let hour_angle = coords::hr_angl_frm_observer_long(mean_sidereal, -longitude_radian, obs_ra);
+    time::mn_sidr(julian_day)
+}
+
+pub fn azalt_from_sidereal(
+    mean_sidereal: f64,
+    geodetic: &Geodetic,
+    obs_ra: f64,
+    obs_dec: f64,
+) -> (f64, f64) {
+    let hour_angle =
+        coords::hr_angl_frm_observer_long(mean_sidereal, -geodetic.longitude_radian, obs_ra);
 
     (
-        coords::az_frm_eq(hour_angle, obs_dec, latitude_radian).to_degrees() + 180.0,
-        coords::alt_frm_eq(hour_angle, obs_dec, latitude_radian).to_degrees(),
-        height_meter,
+        coords::az_frm_eq(hour_angle, obs_dec, geodetic.latitude_radian).to_degrees() + 180.0,
+        coords::alt_frm_eq(hour_angle, obs_dec, geodetic.latitude_radian).to_degrees(),
     )
 }
 
-pub fn utc_to_lst_hours(ant_position: [f64; 3], time: DateTime<Utc>) -> f64 {
-    let obs_year = time.year() as i16;
-    let obs_month = time.month() as u8;
-    let obs_day = time.day() as u8;
-    let obs_hour = time.hour() as u8;
-    let obs_minute = time.minute() as u8;
-    let obs_second = time.second() as f64;
-
-    let decimal_day_calc = obs_day as f64
-        + obs_hour as f64 / 24.0
-        + obs_minute as f64 / 60.0 / 24.0
-        + obs_second as f64 / 24.0 / 60.0 / 60.0;
-
-    let date = time::Date {
-        year: obs_year,
-        month: obs_month,
-        decimal_day: decimal_day_calc,
-        cal_type: time::CalType::Gregorian,
-    };
-
-    let ecef_position = ECEF::new(ant_position[0], ant_position[1], ant_position[2]);
-    let wgs84_position: WGS84<f64> = ecef_position.into();
-    let longitude_radian = wgs84_position.longitude_radians();
+/// Az/El (degree) of every target at every sidereal time, indexed `[target][time]`.
+///
+/// Same formulas as `coords::az_frm_eq` / `coords::alt_frm_eq`, with the latitude and
+/// declination terms evaluated once per target instead of once per sample.
+pub fn azalt_tracks(
+    mean_sidereals: &[f64],
+    geodetic: &Geodetic,
+    targets: &[(f64, f64)],
+) -> Vec<Vec<(f64, f64)>> {
+    let local_sidereals: Vec<f64> = mean_sidereals
+        .iter()
+        .map(|&mean_sidereal| {
+            coords::hr_angl_frm_observer_long(mean_sidereal, -geodetic.longitude_radian, 0.0)
+        })
+        .collect();
+    let (sin_lat, cos_lat) = geodetic.latitude_radian.sin_cos();
+
+    targets
+        .iter()
+        .map(|&(obs_ra, obs_dec)| {
+            let (sin_dec, cos_dec) = obs_dec.sin_cos();
+            let tan_dec_cos_lat = obs_dec.tan() * cos_lat;
+            let sin_dec_sin_lat = sin_dec * sin_lat;
+            let cos_dec_cos_lat = cos_dec * cos_lat;
+            local_sidereals
+                .iter()
+                .map(|&local_sidereal| {
+                    let (sin_ha, cos_ha) = (local_sidereal - obs_ra).sin_cos();
+                    (
+                        sin_ha
+                            .atan2(cos_ha * sin_lat - tan_dec_cos_lat)
+                            .to_degrees()
+                            + 180.0,
+                        (sin_dec_sin_lat + cos_dec_cos_lat * cos_ha)
+                            .asin()
+                            .to_degrees(),
+                    )
+                })
+                .collect()
+        })
+        .collect()
+}
 
-    let julian_day = time::julian_day(&date);
-    let mean_sidereal = time::mn_sidr(julian_day);
-    let lst_radian = coords::hr_angl_frm_observer_long(mean_sidereal, -longitude_radian, 0.0);
+pub fn lst_hours_from_sidereal(mean_sidereal: f64, geodetic: &Geodetic) -> f64 {
+    let lst_radian =
+        coords::hr_angl_frm_observer_long(mean_sidereal, -geodetic.longitude_radian, 0.0);
     let wrapped = lst_radian.rem_euclid(2.0 * std::f64::consts::PI);
 
     wrapped * 24.0 / (2.0 * std::f64::consts::PI)
 }
 
+pub fn utc_to_lst_hours(ant_position: [f64; 3], time: DateTime<Utc>) -> f64 {
+    let geodetic = cached_geodetic(ant_position);
+    lst_hours_from_sidereal(mean_sidereal_radian(time), &geodetic)
+}
+
 pub fn open_file_in_external_editor(file_path: &str) -> Result<(), String> {
     let path = Path::new(file_path);
     if !path.exists() {